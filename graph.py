@@ -1,210 +1,974 @@
 import os
 import argparse
-import networkx as nx
-import matplotlib.pyplot as plt
-from kubernetes import client, config
-from concurrent.futures import ThreadPoolExecutor
-from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import astuple, dataclass
+from functools import partial
+from itertools import chain
 import fnmatch
+import gzip
+import hashlib
+import json
+import logging
+import queue
+import re
+import shutil
+import subprocess
+import sys
+import threading
+import time
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Seconds a listed resource set is reused before it is fetched again.
+CACHE_TTL = 30
+
+# Entries kept per cache table; beyond this the oldest are dropped first.
+CACHE_MAX_ENTRIES = 256
+
+# Guards inserts into the cache tables, which run on executor threads.
+_cache_lock = threading.Lock()
+
+# (resource_type, namespace, field_selector) -> (fetch time, resources). The
+# resources are stored as tuples so callers cannot mutate a cached result.
+_resource_cache: dict[tuple[str, str | None, str | None], tuple[float, tuple]] = {}
+
+# CoreV1Api shared by every API helper, created by main.
+_api = None
+
+# Thread pool shared by all concurrent API calls, sized by main.
+_executor = None
+
+# (resource_type, namespace) pairs the API server refused to list or read
+# with 401/403; namespace is None for cluster-wide lists and volumes.
+_forbidden = set()
+
+# Single-object reads: (namespace, name) -> (fetch time, PvcLite or None)
+# and volume name -> (fetch time, VolumeLite or None).
+_pvc_reads = {}
+_volume_reads = {}
+
+# (credentials, seconds) when --disk-cache is set: list results are saved to
+# DISK_CACHE_DIR and reused by later runs for that many seconds. credentials is
+# (kubeconfig file, context, user, API server URL), so runs whose RBAC may
+# differ never share results.
+_disk_cache = None
+
+log = logging.getLogger(__name__)
+
+# Above this many namespaces a single cluster-wide list call, filtered
+# client-side, replaces the per-namespace list calls.
+NAMESPACE_BATCH_THRESHOLD = 2
+
+# Items requested per list call; larger lists are paged with continue tokens.
+LIST_PAGE_SIZE = 500
+
+# Up to this many PVCs or volumes are read one by one instead of listed.
+SINGLE_READ_THRESHOLD = 20
+
+# Directory of the list results saved with --disk-cache.
+DISK_CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'pods-graph')
+
+# Server-side timeout, in seconds, of each list call.
+LIST_TIMEOUT_SECONDS = 30
+
+# Concurrent API calls unless --max-workers says otherwise. Kept small so
+# many namespaces do not flood the API server with parallel lists.
+DEFAULT_MAX_WORKERS = 6
+
+# Extra headers for list calls. Pod lists compress well, and urllib3 decodes
+# gzip transparently when the raw response is read. Watch streams are read
+# undecoded by the client, so they do not send this header.
+LIST_HEADERS = {'Accept-Encoding': 'gzip'}
+
+# Type line shown in the labels of storage nodes, by node kind.
+NODE_TYPES = {'pvc': 'PVC', 'volume': 'Volume'}
+
+# Node count above which the spring layout is replaced by a faster one.
+LARGE_GRAPH_THRESHOLD = 150
+
+# Spring layout iterations; enough to settle the small graphs it is used for.
+SPRING_ITERATIONS = 20
+
+# Seconds between redraws while following watch events.
+WATCH_REDRAW_INTERVAL = 1.0
+
+# Server-side timeout, in seconds, of each watch stream before it is resumed.
+WATCH_TIMEOUT_SECONDS = 300
+
+# Annotation set on the bookmark that ends the initial events of a watch list.
+INITIAL_EVENTS_END = 'k8s.io/initial-events-end'
+
+
+def _get_api():
+    """Return the CoreV1Api instance shared by all API helpers."""
+    return _api
+
+
+def _get_executor():
+    """Return the thread pool shared by all concurrent API calls."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS)
+    return _executor
 
 
 def load_kube_config(kubeconfig_path):
     """Load the Kubernetes configuration from the specified path."""
+    from kubernetes import config
+
     try:
         config.load_kube_config(config_file=kubeconfig_path)
     except Exception as e:
-        print(f"Failed to load kubeconfig: {e}")
+        log.error("Failed to load kubeconfig: %s", e)
         raise
 
 
-@lru_cache(maxsize=None)
-def get_resources(api_instance, resource_type, namespace=None):
+def get_resources(resource_type, namespace=None, field_selector=None, *, expect_forbidden=False):
     """
     Retrieve Kubernetes resources of a specified type in the given namespace.
     
+    Results are cached for CACHE_TTL seconds, keyed on the resource type,
+    namespace and field selector, and with --disk-cache also across runs (see
+    _disk_lookup). A resource type the credentials may not list (401/403) in
+    a namespace is remembered and returns an empty list for that namespace
+    without further requests.
+    Each resource is trimmed to the fields the graph renders (see trim_pod,
+    trim_pvc and trim_volume).
+    
     Args:
-        api_instance (client.CoreV1Api): Kubernetes API instance.
         resource_type (str): Type of the resource to retrieve ('pods', 'pvcs', 'volumes').
         namespace (str, optional): Kubernetes namespace to retrieve resources from.
+        field_selector (str, optional): Field selector applied by the API server.
+        expect_forbidden (bool, optional): Log a 401/403 at info level only,
+            for callers that fall back to narrower requests (see _gather).
         
     Returns:
-        list: List of resources.
+        tuple: Trimmed resources (PodLite, PvcLite or VolumeLite).
     """
+    from kubernetes.client.exceptions import ApiException
+
+    if (resource_type, namespace) in _forbidden:
+        return ()
+
+    key = (resource_type, namespace, field_selector)
+    cached = _resource_cache.get(key)
+    if cached and time.monotonic() - cached[0] < CACHE_TTL:
+        return cached[1]
+
     try:
-        if resource_type == 'pods':
-            if namespace:
-                return api_instance.list_namespaced_pod(namespace=namespace).items
-            return api_instance.list_pod_for_all_namespaces().items
-        
-        if resource_type == 'pvcs':
-            if namespace:
-                return api_instance.list_namespaced_persistent_volume_claim(namespace=namespace).items
-            return api_instance.list_persistent_volume_claim_for_all_namespaces().items
-        
-        if resource_type == 'volumes':
-            return api_instance.list_persistent_volume().items
-        
+        resources = _disk_lookup(key, partial(iter_resources, resource_type, namespace, field_selector))
+    except ApiException as e:
+        forbidden = e.status in (401, 403)
+        if forbidden:
+            _forbidden.add((resource_type, namespace))
+        log.log(logging.INFO if forbidden and expect_forbidden else logging.WARNING,
+                "Failed to get %s: %s %s", _describe(resource_type, namespace), e.status, e.reason)
+        return ()
+    except Exception as e:
+        log.warning("Failed to get %s: %s", _describe(resource_type, namespace), e)
+        return ()
+
+    _store(_resource_cache, key, resources)
+    return resources
+
+
+def _describe(resource_type, namespace, name=None):
+    """Name a resource type, or one object of it, and its namespace, if any, for log messages."""
+    subject = f"{resource_type} {name}" if name else resource_type
+    return f"{subject} in namespace {namespace}" if namespace else subject
+
+
+def _store(table, key, value):
+    """
+    Save value for key in a cache table of (fetch time, value) entries.
+    
+    Entries are kept in insertion order, so the oldest come first: on each
+    insert, expired entries and any beyond CACHE_MAX_ENTRIES are dropped
+    from the front, which keeps the table bounded.
+    """
+    now = time.monotonic()
+    with _cache_lock:
+        table.pop(key, None)
+        table[key] = (now, value)
+        while len(table) > CACHE_MAX_ENTRIES or now - next(iter(table.values()))[0] > CACHE_TTL:
+            del table[next(iter(table))]
+
+
+def _lookup(table, key, read):
+    """
+    Return the memoized result of read() for key.
+    
+    The lookup table keeps (fetch time, result) per key; a result older than
+    CACHE_TTL is read again and the table updated. A read that raises is not
+    memoized: None is returned and the next lookup reads again.
+    """
+    cached = table.get(key)
+    if cached and time.monotonic() - cached[0] < CACHE_TTL:
+        return cached[1]
+
+    try:
+        result = read()
+    except Exception:
+        return None
+    _store(table, key, result)
+    return result
+
+
+def _disk_lookup(key, read):
+    """
+    Return the resources read() lists for key, as a tuple.
+    
+    With --disk-cache the result is saved to DISK_CACHE_DIR, per credentials
+    and key, and a saved result younger than the configured age is returned
+    instead of calling read(). Files hold the field values of each resource
+    as gzipped JSON; a file that cannot be read or parsed is ignored.
+    """
+    if _disk_cache is None:
+        return tuple(read())
+
+    credentials, max_age = _disk_cache
+    resource_type = key[0]
+    digest = hashlib.sha256(repr((credentials, key)).encode()).hexdigest()[:16]
+    path = os.path.join(DISK_CACHE_DIR, f"{resource_type}-{digest}.json.gz")
+    lite = LITE_TYPES[resource_type]
+    try:
+        if time.time() - os.path.getmtime(path) < max_age:
+            with gzip.open(path, 'rb') as f:
+                rows = json_loads(f.read())
+            # JSON has no tuples; pvc_claims comes back as a list.
+            return tuple(lite(*(tuple(value) if isinstance(value, list) else value for value in row))
+                         for row in rows)
+    except FileNotFoundError:
+        pass
     except Exception as e:
-        print(f"Failed to get {resource_type}: {e}")
-        return []
+        log.debug("Ignoring disk cache %s: %s", path, e)
+
+    resources = tuple(read())
+    # Written aside and renamed so a concurrent run never reads half a file.
+    temp_path = f"{path}.{os.getpid()}"
+    try:
+        os.makedirs(DISK_CACHE_DIR, exist_ok=True)
+        with gzip.open(temp_path, 'wb') as f:
+            f.write(json.dumps([astuple(resource) for resource in resources]).encode())
+        os.replace(temp_path, path)
+    except OSError as e:
+        log.debug("Failed to write disk cache %s: %s", path, e)
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+    return resources
 
 
-def get_resource_status(api_instance, resource_type, namespace, name):
+def get_pvc(namespace, name):
     """
-    Retrieve the status of a Kubernetes resource.
+    Retrieve a single PVC, reading it from the API server at most once per CACHE_TTL.
     
     Args:
-        api_instance (client.CoreV1Api): Kubernetes API instance.
-        resource_type (str): Type of the resource ('pod', 'pvc', 'volume').
-        namespace (str): Kubernetes namespace of the resource.
-        name (str): Name of the resource.
+        namespace (str): Kubernetes namespace of the PVC.
+        name (str): Name of the PVC.
         
     Returns:
-        str: Status of the resource.
+        PvcLite: The trimmed PVC, or None if it could not be read.
     """
-    try:
-        if resource_type == 'pod':
-            status = api_instance.read_namespaced_pod_status(name=name, namespace=namespace)
-            return status.status.phase
+    return _lookup(_pvc_reads, (namespace, name), partial(_read_resource, 'pvcs', name, namespace))
+
+
+def get_volume(name):
+    """
+    Retrieve a single Persistent Volume, reading it from the API server at most once per CACHE_TTL.
+    
+    Args:
+        name (str): Name of the volume.
         
-        if resource_type == 'pvc':
-            status = api_instance.read_namespaced_persistent_volume_claim_status(name=name, namespace=namespace)
-            return status.status.phase
+    Returns:
+        VolumeLite: The trimmed volume, or None if it could not be read.
+    """
+    return _lookup(_volume_reads, name, partial(_read_resource, 'volumes', name))
+
+
+def _read_resource(resource_type, name, namespace=None):
+    """
+    Read one PVC or volume from the API server; see get_pvc and get_volume.
+    
+    Returns None when the object does not exist or may not be read (404,
+    401/403). Other failures, such as a 5xx or a timeout, are logged and
+    raised so _lookup does not memoize them.
+    """
+    from kubernetes.client.exceptions import ApiException
+
+    if (resource_type, namespace) in _forbidden:
+        return None
+
+    api_instance = _get_api()
+    try:
+        if resource_type == 'pvcs':
+            response = api_instance.read_namespaced_persistent_volume_claim(
+                name=name, namespace=namespace, _preload_content=False)
+            return trim_pvc(json_loads(response.data))
         
-        if resource_type == 'volume':
-            status = api_instance.read_persistent_volume(name=name)
-            return status.status.phase
-            
+        response = api_instance.read_persistent_volume(name=name, _preload_content=False)
+        return trim_volume(json_loads(response.data))
+    
+    except ApiException as e:
+        if e.status == 404:
+            return None
+        log.warning("Failed to get %s: %s %s", _describe(resource_type, namespace, name), e.status, e.reason)
+        if e.status in (401, 403):
+            _forbidden.add((resource_type, namespace))
+            return None
+        raise
     except Exception as e:
-        print(f"Failed to get status for {resource_type} {name}: {e}")
-        return "Unknown"
+        log.warning("Failed to get %s: %s", _describe(resource_type, namespace, name), e)
+        raise
+
+
+def iter_resources(resource_type, namespace=None, field_selector=None):
+    """
+    Yield trimmed resources of a type page by page.
+    
+    The list is requested LIST_PAGE_SIZE items at a time and each raw page is
+    dropped once its items are trimmed, so memory holds at most one raw page.
+    
+    Args:
+        resource_type (str): Type of the resource to list ('pods', 'pvcs', 'volumes').
+        namespace (str, optional): Kubernetes namespace to list resources from.
+        field_selector (str, optional): Field selector applied by the API server.
+        
+    Yields:
+        PodLite | PvcLite | VolumeLite: Trimmed resource.
+    """
+    api_instance = _get_api()
+    if resource_type == 'pods':
+        if namespace:
+            list_call = partial(api_instance.list_namespaced_pod, namespace=namespace)
+        else:
+            list_call = api_instance.list_pod_for_all_namespaces
+        trim = trim_pod
+    
+    elif resource_type == 'pvcs':
+        if namespace:
+            list_call = partial(api_instance.list_namespaced_persistent_volume_claim, namespace=namespace)
+        else:
+            list_call = api_instance.list_persistent_volume_claim_for_all_namespaces
+        trim = trim_pvc
+    
+    elif resource_type == 'volumes':
+        list_call = api_instance.list_persistent_volume
+        trim = trim_volume
+
+    else:
+        return
+
+    # resourceVersion "0" lets the API server answer from its watch cache
+    # instead of a quorum read from etcd. Continued pages must not set it:
+    # the continue token already pins the snapshot.
+    page_options = {'resource_version': '0'}
+    if field_selector:
+        list_call = partial(list_call, field_selector=field_selector)
+    while True:
+        # _preload_content=False returns the raw response, skipping the client's
+        # model deserialization of fields the graph never reads.
+        page = json_loads(list_call(limit=LIST_PAGE_SIZE, timeout_seconds=LIST_TIMEOUT_SECONDS,
+                                    _headers=LIST_HEADERS, _preload_content=False,
+                                    **page_options).data)
+        for item in page.get('items') or []:
+            yield trim(item)
+        continue_token = (page.get('metadata') or {}).get('continue')
+        if not continue_token:
+            return
+        page_options = {'_continue': continue_token}
+
+
+@dataclass(frozen=True, slots=True)
+class PodLite:
+    """Fields of a pod rendered in the graph."""
+    name: str
+    namespace: str
+    phase: str = "Unknown"
+    pvc_claims: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class PvcLite:
+    """Fields of a Persistent Volume Claim rendered in the graph."""
+    name: str
+    namespace: str
+    phase: str = "Unknown"
+    capacity: str = "Unknown"
+    volume_name: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class VolumeLite:
+    """Fields of a Persistent Volume rendered in the graph."""
+    name: str
+    phase: str = "Unknown"
+    capacity: str = "Unknown"
+
 
+# Trimmed class of each resource type, used to rebuild disk cache entries.
+LITE_TYPES = {'pods': PodLite, 'pvcs': PvcLite, 'volumes': VolumeLite}
 
-def get_resource_capacity(api_instance, resource_type, name, namespace=None):
+
+def _intern(value):
+    """Intern a string so repeated namespaces, phases and capacities share one object."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def trim_pod(item):
     """
-    Retrieve the capacity of a Kubernetes resource.
+    Reduce a raw pod object to the fields used by the graph.
     
     Args:
-        api_instance (client.CoreV1Api): Kubernetes API instance.
-        resource_type (str): Type of the resource ('pvc', 'volume').
-        name (str): Name of the resource.
-        namespace (str, optional): Namespace for PVCs.
+        item (dict): Pod as returned by the API server.
         
     Returns:
-        str: Capacity of the resource.
+        PodLite: Pod name, namespace, phase and the names of the PVCs it claims.
     """
-    try:
-        if resource_type == 'pvc':
-            pvc = api_instance.read_namespaced_persistent_volume_claim(name=name, namespace=namespace)
-            return pvc.spec.resources.requests['storage']
+    metadata = item.get('metadata') or {}
+    volumes = (item.get('spec') or {}).get('volumes') or []
+    return PodLite(
+        name=metadata.get('name'),
+        namespace=_intern(metadata.get('namespace')),
+        phase=_intern((item.get('status') or {}).get('phase') or "Unknown"),
+        pvc_claims=tuple(volume['persistentVolumeClaim']['claimName']
+                         for volume in volumes if volume.get('persistentVolumeClaim')),
+    )
+
+
+def trim_pvc(item):
+    """
+    Reduce a raw PVC object to the fields used by the graph.
+    
+    Args:
+        item (dict): PVC as returned by the API server.
         
-        if resource_type == 'volume':
-            volume = api_instance.read_persistent_volume(name=name)
-            return volume.spec.capacity['storage']
-            
-    except Exception as e:
-        print(f"Failed to get capacity for {resource_type} {name}: {e}")
-        return "Unknown"
+    Returns:
+        PvcLite: PVC name, namespace, phase, requested capacity and bound volume name.
+    """
+    metadata = item.get('metadata') or {}
+    spec = item.get('spec') or {}
+    requests = (spec.get('resources') or {}).get('requests') or {}
+    return PvcLite(
+        name=metadata.get('name'),
+        namespace=_intern(metadata.get('namespace')),
+        phase=_intern((item.get('status') or {}).get('phase') or "Unknown"),
+        capacity=_intern(requests.get('storage', "Unknown")),
+        volume_name=spec.get('volumeName'),
+    )
 
 
-def create_resource_graph(pods, pvcs, volumes, api_instance):
-    """Create a directed graph of Kubernetes resources."""
+def trim_volume(item):
+    """
+    Reduce a raw Persistent Volume object to the fields used by the graph.
+    
+    Args:
+        item (dict): Persistent Volume as returned by the API server.
+        
+    Returns:
+        VolumeLite: Volume name, phase and capacity.
+    """
+    capacity = (item.get('spec') or {}).get('capacity') or {}
+    return VolumeLite(
+        name=(item.get('metadata') or {}).get('name'),
+        phase=_intern((item.get('status') or {}).get('phase') or "Unknown"),
+        capacity=_intern(capacity.get('storage', "Unknown")),
+    )
+
+
+def create_resource_graph(pods, pvcs, volumes):
+    """
+    Create a directed graph of Kubernetes resources.
+    
+    Each argument is an iterable of trimmed resources and is consumed once,
+    so pods can be streamed straight from iter_resources. Nodes are keyed
+    (kind, namespace, name), with namespace None for volumes, so same-named
+    objects of different kinds or namespaces stay apart. They carry their
+    'name', 'kind', 'status' and 'capacity'; display labels are rendered
+    only when the graph is drawn (see node_labels).
+    """
+    import networkx as nx
+
     G = nx.DiGraph()
-    pvc_names = set()
+    # Index the listed objects so status and capacity are read locally
+    # instead of issuing one read_* request per resource.
+    pvcs_by_key = {(pvc.namespace, pvc.name): pvc for pvc in pvcs}
+    volumes_by_name = {volume.name: volume for volume in volumes}
+    # Nodes and edges are collected first and inserted in bulk; `seen` keeps
+    # a PVC or volume reached from several pods from being added twice.
+    nodes = []
+    edges = []
+    seen = set()
     
     for pod in pods:
-        pod_name = pod.metadata.name
-        pod_status = get_resource_status(api_instance, 'pod', pod.metadata.namespace, pod_name)
-        G.add_node(pod_name, label=f"{pod_name}\nStatus: {pod_status}")
+        pod_node = ('pod', pod.namespace, pod.name)
+        nodes.append((pod_node, {'name': pod.name, 'kind': 'pod', 'status': pod.phase}))
         
-        for volume in pod.spec.volumes:
-            if volume.persistent_volume_claim:
-                pvc_name = volume.persistent_volume_claim.claim_name
-                pvc_names.add(pvc_name)
-                pvc_capacity = get_resource_capacity(api_instance, 'pvc', pvc_name, pod.metadata.namespace)
-                pvc_status = get_resource_status(api_instance, 'pvc', pod.metadata.namespace, pvc_name)
-                G.add_node(pvc_name, label=f"{pvc_name}\nCapacity: {pvc_capacity}\nStatus: {pvc_status}\nType: PVC")
-                G.add_edge(pod_name, pvc_name, label='uses')
-    
-    for pvc in pvcs:
-        if pvc.metadata.name in pvc_names:
-            pvc_name = pvc.metadata.name
-            pvc_capacity = get_resource_capacity(api_instance, 'pvc', pvc_name, pvc.metadata.namespace)
-            pvc_status = get_resource_status(api_instance, 'pvc', pvc.metadata.namespace, pvc_name)
-            G.add_node(pvc_name, label=f"{pvc_name}\nCapacity: {pvc_capacity}\nStatus: {pvc_status}\nType: PVC")
+        for pvc_name in pod.pvc_claims:
+            pvc_node = ('pvc', pod.namespace, pvc_name)
+            edges.append((pod_node, pvc_node, {'label': 'uses'}))
+            if pvc_node in seen:
+                continue
+            seen.add(pvc_node)
+            pvc = pvcs_by_key.get((pod.namespace, pvc_name)) or PvcLite(pvc_name, pod.namespace)
+            nodes.append((pvc_node, {'name': pvc_name, 'kind': 'pvc', 'capacity': pvc.capacity,
+                                     'status': pvc.phase}))
             
-            if pvc.spec.volume_name:
-                volume_name = pvc.spec.volume_name
-                volume_capacity = get_resource_capacity(api_instance, 'volume', volume_name)
-                volume_status = get_resource_status(api_instance, 'volume', None, volume_name)
-                G.add_node(volume_name, label=f"{volume_name}\nCapacity: {volume_capacity}\nStatus: {volume_status}\nType: Volume")
-                G.add_edge(pvc_name, volume_name, label='bound to')
-    
-    for volume in volumes:
-        volume_name = volume.metadata.name
-        volume_capacity = get_resource_capacity(api_instance, 'volume', volume_name)
-        volume_status = get_resource_status(api_instance, 'volume', None, volume_name)
-        G.add_node(volume_name, label=f"{volume_name}\nCapacity: {volume_capacity}\nStatus: {volume_status}\nType: Volume")
+            volume_name = pvc.volume_name
+            if volume_name:
+                volume_node = ('volume', None, volume_name)
+                edges.append((pvc_node, volume_node, {'label': 'bound to'}))
+                if volume_node not in seen:
+                    seen.add(volume_node)
+                    volume = volumes_by_name.get(volume_name) or VolumeLite(volume_name)
+                    nodes.append((volume_node, {'name': volume_name, 'kind': 'volume',
+                                                'capacity': volume.capacity, 'status': volume.phase}))
+    
+    for volume_name, volume in volumes_by_name.items():
+        volume_node = ('volume', None, volume_name)
+        if volume_node not in seen:
+            nodes.append((volume_node, {'name': volume_name, 'kind': 'volume', 'capacity': volume.capacity,
+                                        'status': volume.phase}))
     
+    G.add_nodes_from(nodes)
+    G.add_edges_from(edges)
     return G
 
 
-def draw_graph(G):
-    """Draw the directed graph of Kubernetes resources."""
-    pos = nx.spring_layout(G, seed=42)
-    labels = nx.get_edge_attributes(G, 'label')
-    node_labels = nx.get_node_attributes(G, 'label')
+def compute_layout(G):
+    """
+    Compute node positions for drawing the graph.
+    
+    Graphs above LARGE_GRAPH_THRESHOLD nodes are laid out by Graphviz's
+    multilevel sfdp engine when pygraphviz is installed, and otherwise in
+    three columns (Pods, PVCs, Volumes) by their 'kind', which takes linear
+    time. Smaller graphs use a shortened run of networkx's spring layout.
+    
+    Args:
+        G (nx.DiGraph): Graph built by create_resource_graph.
+        
+    Returns:
+        dict: Mapping of node to (x, y) position.
+    """
+    import networkx as nx
+
+    if len(G) > LARGE_GRAPH_THRESHOLD:
+        try:
+            return nx.nx_agraph.graphviz_layout(G, prog='sfdp')
+        except ImportError:
+            # 'pod' < 'pvc' < 'volume', so the columns come out in that order.
+            return nx.multipartite_layout(G, subset_key='kind')
+    return nx.spring_layout(G, seed=42, iterations=SPRING_ITERATIONS)
+
+
+def node_labels(G):
+    """
+    Render the display label of every node from its stored attributes.
+    
+    Args:
+        G (nx.DiGraph): Graph built by create_resource_graph.
+        
+    Returns:
+        dict: Mapping of node to its multi-line label.
+    """
+    labels = {}
+    for node, data in G.nodes(data=True):
+        if data['kind'] == 'pod':
+            labels[node] = f"{data['name']}\nStatus: {data['status']}"
+        else:
+            labels[node] = (f"{data['name']}\nCapacity: {data['capacity']}\nStatus: {data['status']}"
+                            f"\nType: {NODE_TYPES[data['kind']]}")
+    return labels
+
+
+def draw_graph(G, block=True, path=None, image_format=None):
+    """
+    Draw the directed graph of Kubernetes resources.
+    
+    Args:
+        G (nx.DiGraph): Graph built by create_resource_graph.
+        block (bool): Block until the window is closed. When False the
+            existing figure is redrawn in place, as used by --watch.
+        path (str, optional): Save the figure to this file with the
+            non-interactive Agg backend instead of opening a window.
+        image_format (str, optional): Format of the saved file ('svg' or
+            'png'); taken from the extension of path when not given.
+    """
+    import matplotlib
+    if path:
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import networkx as nx
+
+    pos = compute_layout(G)
+    edge_labels = nx.get_edge_attributes(G, 'label')
 
-    plt.figure(figsize=(14, 10))
-    nx.draw(G, pos, with_labels=True, labels=node_labels, node_size=3000,
+    plt.figure("Kubernetes Resource Graph", figsize=(14, 10))
+    plt.clf()
+    nx.draw(G, pos, with_labels=True, labels=node_labels(G), node_size=3000,
             node_color='lightblue', font_size=10, font_weight='bold')
-    nx.draw_networkx_edge_labels(G, pos, edge_labels=labels, font_color='red')
+    nx.draw_networkx_edge_labels(G, pos, edge_labels=edge_labels, font_color='red')
     plt.title("Kubernetes Resource Graph")
-    plt.show()
+    if path:
+        plt.savefig(path, format=image_format)
+        plt.close()
+    elif block:
+        plt.show()
+    else:
+        plt.draw()
+
+
+def _dot_quote(text):
+    """Quote a string as a DOT identifier."""
+    return '"' + str(text).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') + '"'
+
+
+def write_svg(G, path):
+    """
+    Render the graph to an SVG file with Graphviz's sfdp.
+    
+    The DOT description is streamed to sfdp line by line, so neither
+    matplotlib nor an intermediate file is involved.
+    
+    Args:
+        G (nx.DiGraph): Graph built by create_resource_graph.
+        path (str): Destination SVG file.
+    """
+    with subprocess.Popen(['sfdp', '-Tsvg', '-o', path], stdin=subprocess.PIPE, text=True) as sfdp:
+        sfdp.stdin.write('digraph {\nnode [shape=box, style=filled, fillcolor=lightblue];\n')
+        for node, label in node_labels(G).items():
+            sfdp.stdin.write(f"{_dot_quote(node)} [label={_dot_quote(label)}];\n")
+        for source, target, data in G.edges(data=True):
+            sfdp.stdin.write(f"{_dot_quote(source)} -> {_dot_quote(target)} "
+                             f"[label={_dot_quote(data.get('label', ''))}, fontcolor=red];\n")
+        sfdp.stdin.write('}\n')
+        sfdp.stdin.close()
+    if sfdp.returncode:
+        raise RuntimeError(f"sfdp exited with status {sfdp.returncode}")
+
 
+def write_html(G, path):
+    """
+    Write the graph as an interactive HTML page with pyvis.
+    
+    Args:
+        G (nx.DiGraph): Graph built by create_resource_graph.
+        path (str): Destination HTML file.
+    """
+    from pyvis.network import Network
 
-def fetch_resources(api_instance, namespaces, pod_patterns):
+    # pyvis only accepts str or int node ids, so nodes are numbered.
+    ids = {node: index for index, node in enumerate(G)}
+    network = Network(directed=True)
+    for node, label in node_labels(G).items():
+        network.add_node(ids[node], label=label)
+    for source, target, data in G.edges(data=True):
+        network.add_edge(ids[source], ids[target], label=data.get('label', ''))
+    network.write_html(path)
+
+
+def compile_patterns(patterns):
+    """Compile pod name wildcard patterns into one regular expression."""
+    return re.compile('|'.join(fnmatch.translate(pattern) for pattern in patterns))
+
+
+def is_wildcard(pattern):
+    """Check if a pod name pattern contains wildcard characters."""
+    return any(char in pattern for char in '*?[')
+
+
+def _gather(resource_type, futures, batched=None, selectors=(None,)):
+    """
+    Collect the results of the list calls submitted for a resource type.
+    
+    Args:
+        resource_type (str): Type of the listed resources ('pods' or 'pvcs').
+        futures (list): Futures of the get_resources calls.
+        batched (list, optional): Namespaces requested when the calls listed
+            across all namespaces. Results are narrowed to them; if the
+            cluster-wide list was refused (401/403), each namespace is listed
+            on its own instead, as RBAC may grant the namespaces but not the
+            cluster scope.
+        selectors (list, optional): Field selectors of the calls, repeated
+            for each namespace on fallback.
+        
+    Returns:
+        list: Trimmed resources.
+    """
+    resources = list(chain.from_iterable(future.result() for future in as_completed(futures)))
+    if batched is None:
+        return resources
+    if (resource_type, None) not in _forbidden:
+        wanted = set(batched)
+        return [resource for resource in resources if resource.namespace in wanted]
+
+    executor = _get_executor()
+    futures = [executor.submit(get_resources, resource_type, ns, selector)
+               for ns in dict.fromkeys(batched) for selector in selectors]
+    return list(chain.from_iterable(future.result() for future in as_completed(futures)))
+
+
+def fetch_resources(namespaces, pod_patterns):
     """Fetch Kubernetes resources (pods, PVCs, volumes) from the specified namespaces."""
-    def matches_pattern(name, patterns):
-        """Check if the pod name matches any of the provided patterns."""
-        return any(fnmatch.fnmatch(name, pattern) for pattern in patterns)
+    if namespaces and len(namespaces) > NAMESPACE_BATCH_THRESHOLD:
+        # Field selectors cannot express "namespace in (...)", so list once
+        # across all namespaces and keep the requested ones.
+        scopes, batched = [None], namespaces
+    else:
+        scopes, batched = namespaces or [None], None
+
+    if pod_patterns and not any(map(is_wildcard, pod_patterns)):
+        # Exact pod names are selected by the API server, one list per name.
+        pod_selectors = [f"metadata.name={name}" for name in dict.fromkeys(pod_patterns)]
+        pod_filter = None
+    else:
+        pod_selectors = [None]
+        pod_filter = compile_patterns(pod_patterns) if pod_patterns else None
+
+    # Pods, PVCs and volumes are independent, so all list calls are in
+    # flight at once and the wait is bounded by the slowest of them. With a
+    # pod filter the PVC list waits for the pods instead: the few claims they
+    # make are usually cheaper to read one by one than the whole PVC list,
+    # and the same goes for the volumes bound to those claims.
+    executor = _get_executor()
+    volumes_future = None if pod_patterns else executor.submit(get_resources, 'volumes')
+    # A refused cluster-wide list falls back to per-namespace lists in _gather,
+    # which warn themselves if they fail too.
+    list_call = partial(get_resources, expect_forbidden=batched is not None)
+    pod_futures = [executor.submit(list_call, 'pods', ns, selector) for ns in scopes for selector in pod_selectors]
+    pvc_futures = None if pod_patterns else [executor.submit(list_call, 'pvcs', ns) for ns in scopes]
+    pods = _gather('pods', pod_futures, batched, pod_selectors)
+    if pod_filter:
+        pods = [pod for pod in pods if pod_filter.match(pod.name)]
+
+    claims = {(pod.namespace, claim) for pod in pods for claim in pod.pvc_claims}
+    if pvc_futures is None and len(claims) > SINGLE_READ_THRESHOLD:
+        pvc_futures = [executor.submit(list_call, 'pvcs', ns) for ns in scopes]
 
-    pods = []
     pvcs = []
+    if pvc_futures is not None:
+        pvcs = _gather('pvcs', pvc_futures, batched)
 
-    if namespaces:
-        with ThreadPoolExecutor() as executor:
-            all_pods = sum(executor.map(lambda ns: get_resources(api_instance, 'pods', ns), namespaces), [])
-            if pod_patterns:
-                pods = [pod for pod in all_pods if matches_pattern(pod.metadata.name, pod_patterns)]
-            else:
-                pods = all_pods
+    # Claims without a listed PVC (all of them when PVCs were not listed, or
+    # those a failed list call missed) and bindings without a listed volume
+    # are read one by one, in parallel and memoized.
+    missing_pvcs = claims - {(pvc.namespace, pvc.name) for pvc in pvcs}
+    pvcs += [pvc for pvc in executor.map(lambda key: get_pvc(*key), missing_pvcs) if pvc]
 
-            pvcs = sum(executor.map(lambda ns: get_resources(api_instance, 'pvcs', ns), namespaces), [])
+    bound = {pvc.volume_name for pvc in pvcs if pvc.volume_name}
+    if volumes_future is not None:
+        volumes = list(volumes_future.result())
+    elif len(bound) > SINGLE_READ_THRESHOLD:
+        volumes = [volume for volume in get_resources('volumes') if volume.name in bound]
     else:
-        all_pods = get_resources(api_instance, 'pods')
-        if pod_patterns:
-            pods = [pod for pod in all_pods if matches_pattern(pod.metadata.name, pod_patterns)]
-        else:
-            pods = all_pods
+        # Also skips the cluster-scoped list, and the RBAC it needs, when
+        # none of the selected claims is bound.
+        volumes = []
 
-        pvcs = get_resources(api_instance, 'pvcs')
+    missing_volumes = bound - {volume.name for volume in volumes}
+    volumes += [volume for volume in executor.map(get_volume, missing_volumes) if volume]
 
-    volumes = get_resources(api_instance, 'volumes')
     return pods, pvcs, volumes
 
 
-def main(kubeconfig_path, namespaces, pod_patterns):
+def watch_resources(resource_type, events, namespace=None):
+    """
+    Stream watch events for a resource type in a namespace or across all namespaces.
+    
+    The watch starts with the current state sent as ADDED events, followed by
+    a bookmark marking the end of the initial events, and then delivers only
+    changes. Each event is put on the queue as ((resource_type, namespace),
+    event type, trimmed resource); failures are reported as an 'ERROR' event.
+    
+    Streams end after WATCH_TIMEOUT_SECONDS and are resumed from the last
+    resourceVersion seen. When that is too old (410 Gone) the state is sent
+    again from scratch, preceded by a 'RESET' event.
+    
+    Args:
+        resource_type (str): Type of the resource to watch ('pods', 'pvcs', 'volumes').
+        events (queue.Queue): Queue receiving the events.
+        namespace (str, optional): Kubernetes namespace to watch; volumes are
+            cluster-scoped and always watched across the cluster.
+    """
+    from kubernetes import watch
+    from kubernetes.client.exceptions import ApiException
+
+    api_instance = _get_api()
+    trim = {'pods': trim_pod, 'pvcs': trim_pvc, 'volumes': trim_volume}[resource_type]
+    if resource_type == 'volumes':
+        list_call, scope = api_instance.list_persistent_volume, {}
+    elif namespace:
+        list_call, scope = {
+            'pods': api_instance.list_namespaced_pod,
+            'pvcs': api_instance.list_namespaced_persistent_volume_claim,
+        }[resource_type], {'namespace': namespace}
+    else:
+        list_call, scope = {
+            'pods': api_instance.list_pod_for_all_namespaces,
+            'pvcs': api_instance.list_persistent_volume_claim_for_all_namespaces,
+        }[resource_type], {}
+
+    # Events are trimmed straight from raw_object. With a falsy return type
+    # the watch only parses each event's JSON instead of also building a V1
+    # model from it; deserialize=False would skip the same work but breaks the
+    # watch's handling of ERROR events, such as 410 Gone.
+    stream_watch = watch.Watch()
+    stream_watch.get_return_type = lambda func: None
+
+    stream = (resource_type, namespace)
+    resource_version = None
+    while True:
+        if resource_version is None:
+            events.put((stream, 'RESET', None))
+            options = {'send_initial_events': True, 'resource_version_match': 'NotOlderThan'}
+        else:
+            options = {'resource_version': resource_version}
+        try:
+            # With timeout_seconds the stream ends instead of reconnecting on
+            # its own, which would replay the initial events every time.
+            for event in stream_watch.stream(list_call, allow_watch_bookmarks=True,
+                                             timeout_seconds=WATCH_TIMEOUT_SECONDS, **scope, **options):
+                obj = event['raw_object']
+                metadata = obj.get('metadata') or {}
+                resource_version = metadata.get('resourceVersion') or resource_version
+                if event['type'] == 'BOOKMARK':
+                    annotations = metadata.get('annotations') or {}
+                    if annotations.get(INITIAL_EVENTS_END) == 'true':
+                        events.put((stream, 'SYNCED', None))
+                else:
+                    events.put((stream, event['type'], trim(obj)))
+        except ApiException as e:
+            if e.status != 410:
+                events.put((stream, 'ERROR', e))
+                return
+            resource_version = None
+        except Exception as e:
+            events.put((stream, 'ERROR', e))
+            return
+
+
+def watch_graph(namespaces, pod_patterns):
+    """
+    Draw the resource graph and keep redrawing it as watch events arrive.
+    
+    Pods and PVCs are watched per requested namespace, or across all
+    namespaces when none is given, and volumes across the cluster. The state
+    of each watch is kept in memory and updated from ADDED, MODIFIED and
+    DELETED events, so redraws never re-list resources from the API server.
+    A 'RESET' event clears the state of its watch, and redraws wait until
+    that watch is synced again.
+    Runs until interrupted.
+    
+    Args:
+        namespaces (list): Namespaces to watch, or None for all namespaces.
+        pod_patterns (list): Pod name patterns to keep, or None for all pods.
+    """
+    import matplotlib.pyplot as plt
+
+    events = queue.Queue()
+    scopes = dict.fromkeys(namespaces) if namespaces else [None]
+    streams = [(resource_type, ns) for resource_type in ('pods', 'pvcs') for ns in scopes] + [('volumes', None)]
+    state = {stream: {} for stream in streams}
+    for resource_type, ns in streams:
+        threading.Thread(target=watch_resources, args=(resource_type, events, ns),
+                         daemon=True).start()
+
+    def current(resource_type):
+        return chain.from_iterable(objects.values() for (kind, _), objects in state.items()
+                                   if kind == resource_type)
+
+    pod_filter = compile_patterns(pod_patterns) if pod_patterns else None
+    synced = set()
+    changed = False
+    plt.ion()
+    while True:
+        while True:
+            try:
+                stream, event_type, resource = events.get_nowait()
+            except queue.Empty:
+                break
+            if event_type == 'ERROR':
+                raise RuntimeError(f"Failed to watch {_describe(*stream)}: {resource}")
+            if event_type == 'RESET':
+                state[stream].clear()
+                synced.discard(stream)
+                continue
+            if event_type == 'SYNCED':
+                synced.add(stream)
+                changed = True
+                continue
+            if stream[0] == 'pods' and pod_filter and not pod_filter.match(resource.name):
+                continue
+
+            key = (getattr(resource, 'namespace', None), resource.name)
+            if event_type == 'DELETED':
+                state[stream].pop(key, None)
+            else:
+                state[stream][key] = resource
+            changed = True
+
+        if changed and synced == set(state):
+            G = create_resource_graph(current('pods'), current('pvcs'), current('volumes'))
+            draw_graph(G, block=False)
+            changed = False
+
+        if plt.get_fignums():
+            plt.pause(WATCH_REDRAW_INTERVAL)
+        else:
+            time.sleep(WATCH_REDRAW_INTERVAL)
+
+
+def main(kubeconfig_path, namespaces, pod_patterns, watch_changes=False, output='show', output_file=None,
+         max_workers=DEFAULT_MAX_WORKERS, disk_cache=0):
     """Main function to generate and display the Kubernetes resource graph."""
     if not (namespaces or not pod_patterns):
         raise ValueError("Pod patterns (-p) can only be used with namespaces (-n).")
+    if watch_changes and output != 'show':
+        raise ValueError("Watching (-w) can only be used with the 'show' output.")
+
+    from kubernetes import client, config
 
     load_kube_config(kubeconfig_path)
-    api_instance = client.CoreV1Api()
+    # A single ApiClient, and with it a single urllib3 pool, serves every call.
+    # The pool keeps twice as many connections alive as there are workers so
+    # concurrent calls reuse open TLS sessions instead of opening new ones.
+    configuration = client.Configuration.get_default_copy()
+    configuration.connection_pool_maxsize = max_workers * 2
+    global _api, _executor, _disk_cache
+    if disk_cache > 0:
+        _, context = config.list_kube_config_contexts(config_file=kubeconfig_path)
+        credentials = (os.path.abspath(kubeconfig_path), context['name'],
+                       context['context'].get('user'), configuration.host)
+        _disk_cache = (credentials, disk_cache)
+    _executor = ThreadPoolExecutor(max_workers=max_workers)
+    with client.ApiClient(configuration) as api_client:
+        _api = client.CoreV1Api(api_client)
+        if watch_changes:
+            watch_graph(namespaces, pod_patterns)
+            return
 
-    pods, pvcs, volumes = fetch_resources(api_instance, namespaces, pod_patterns)
-    G = create_resource_graph(pods, pvcs, volumes, api_instance)
-    draw_graph(G)
+        pods, pvcs, volumes = fetch_resources(namespaces, pod_patterns)
+
+    G = create_resource_graph(pods, pvcs, volumes)
+    if output == 'none':
+        print(f"Graph built with {G.number_of_nodes()} nodes and {G.number_of_edges()} edges")
+        return
+    if output == 'show':
+        draw_graph(G)
+        return
+
+    output_file = output_file or f"pods-graph.{output}"
+    if output == 'svg' and shutil.which('sfdp'):
+        write_svg(G, output_file)
+    elif output == 'html':
+        write_html(G, output_file)
+    else:
+        draw_graph(G, path=output_file, image_format=output)
+    print(f"Graph written to {output_file}")
 
 
 if __name__ == "__main__":
@@ -239,6 +1003,43 @@ if __name__ == "__main__":
         default=None,
         help='Pod name patterns to filter. Use wildcard patterns as needed.'
     )
+    parser.add_argument(
+        '-w', '--watch',
+        action='store_true',
+        help='Keep the graph open and redraw it as resources change, using watch events instead of re-listing.'
+    )
+    parser.add_argument(
+        '--output',
+        choices=['show', 'svg', 'png', 'html', 'none'],
+        default='show',
+        help=("How to render the graph: 'show' opens a matplotlib window, 'svg' renders with Graphviz's "
+              "sfdp (or matplotlib when sfdp is not installed), 'png' saves a matplotlib image, 'html' "
+              "writes an interactive pyvis page and 'none' only builds the graph (default: show).")
+    )
+    parser.add_argument(
+        '-o', '--output-file',
+        type=str,
+        default=None,
+        help='File written by the svg, png and html outputs (default: pods-graph.<output>).'
+    )
+    parser.add_argument(
+        '--max-workers',
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f'Maximum number of concurrent API requests (default: {DEFAULT_MAX_WORKERS}).'
+    )
+    parser.add_argument(
+        '--disk-cache',
+        type=int,
+        default=0,
+        metavar='SECONDS',
+        help=('Save list results under ~/.cache/pods-graph and reuse them in runs within this many seconds '
+              '(default: 0, disabled).')
+    )
     args = parser.parse_args()
+    if args.max_workers < 1:
+        parser.error("--max-workers must be at least 1.")
 
-    main(args.kubeconfig, args.namespaces, args.pods)
+    logging.basicConfig(format="%(levelname)s: %(message)s")
+    main(args.kubeconfig, args.namespaces, args.pods, args.watch, args.output, args.output_file,
+         args.max_workers, args.disk_cache)
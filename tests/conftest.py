@@ -0,0 +1,96 @@
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import graph
+
+PODS = [
+    {"metadata": {"name": "web-1", "namespace": "a"}, "status": {"phase": "Running"},
+     "spec": {"volumes": [{"name": "d", "persistentVolumeClaim": {"claimName": "data"}},
+                          {"name": "c", "configMap": {"name": "settings"}}]}},
+    {"metadata": {"name": "web-2", "namespace": "b"}, "status": {"phase": "Pending"}, "spec": {}},
+    {"metadata": {"name": "db-1", "namespace": "a"}, "status": {"phase": "Running"}, "spec": {}},
+]
+PVCS = [
+    {"metadata": {"name": "data", "namespace": "a"}, "status": {"phase": "Bound"},
+     "spec": {"volumeName": "pv-1", "resources": {"requests": {"storage": "1Gi"}}}},
+    {"metadata": {"name": "logs", "namespace": "b"}, "status": {"phase": "Pending"}, "spec": {}},
+]
+PVS = [
+    {"metadata": {"name": "pv-1"}, "status": {"phase": "Bound"}, "spec": {"capacity": {"storage": "1Gi"}}},
+    {"metadata": {"name": "pv-2"}, "status": {"phase": "Available"}, "spec": {"capacity": {"storage": "2Gi"}}},
+]
+
+
+class Response:
+    def __init__(self, body):
+        self.data = json.dumps(body).encode()
+
+
+class FakeApi:
+    """CoreV1Api stand-in serving PODS, PVCS and PVS and recording every call."""
+
+    def __init__(self, forbidden=()):
+        self.calls = []
+        self.forbidden = set(forbidden)
+
+    def _list(self, method, items, namespace=None, field_selector=None, **kwargs):
+        from kubernetes.client.exceptions import ApiException
+
+        self.calls.append((method, namespace, field_selector))
+        if (method, namespace) in self.forbidden:
+            raise ApiException(status=403, reason="Forbidden")
+        if namespace:
+            items = [item for item in items if item["metadata"]["namespace"] == namespace]
+        if field_selector:
+            name = field_selector.removeprefix("metadata.name=")
+            items = [item for item in items if item["metadata"]["name"] == name]
+        return Response({"metadata": {}, "items": items})
+
+    def _read(self, method, items, name, namespace=None):
+        from kubernetes.client.exceptions import ApiException
+
+        self.calls.append((method, namespace, name))
+        for item in items:
+            if item["metadata"]["name"] == name and item["metadata"].get("namespace") == namespace:
+                return Response(item)
+        raise ApiException(status=404, reason="Not Found")
+
+    def list_namespaced_pod(self, namespace, **kwargs):
+        return self._list("list_namespaced_pod", PODS, namespace, **kwargs)
+
+    def list_pod_for_all_namespaces(self, **kwargs):
+        return self._list("list_pod_for_all_namespaces", PODS, **kwargs)
+
+    def list_namespaced_persistent_volume_claim(self, namespace, **kwargs):
+        return self._list("list_namespaced_persistent_volume_claim", PVCS, namespace, **kwargs)
+
+    def list_persistent_volume_claim_for_all_namespaces(self, **kwargs):
+        return self._list("list_persistent_volume_claim_for_all_namespaces", PVCS, **kwargs)
+
+    def list_persistent_volume(self, **kwargs):
+        return self._list("list_persistent_volume", PVS, **kwargs)
+
+    def read_namespaced_persistent_volume_claim(self, name, namespace, **kwargs):
+        return self._read("read_namespaced_persistent_volume_claim", PVCS, name, namespace)
+
+    def read_persistent_volume(self, name, **kwargs):
+        return self._read("read_persistent_volume", PVS, name)
+
+
+@pytest.fixture
+def api(monkeypatch):
+    """Install a FakeApi and a small executor, with every module cache empty."""
+    fake = FakeApi()
+    monkeypatch.setattr(graph, "_api", fake)
+    monkeypatch.setattr(graph, "_executor", ThreadPoolExecutor(max_workers=2))
+    monkeypatch.setattr(graph, "_disk_cache", None)
+    for table in (graph._resource_cache, graph._pvc_reads, graph._volume_reads, graph._forbidden):
+        table.clear()
+    yield fake
+    graph._executor.shutdown()
@@ -0,0 +1,154 @@
+import gzip
+import os
+
+import pytest
+
+import graph
+from conftest import PODS, PVCS, PVS
+from graph import PodLite, PvcLite, VolumeLite
+
+
+def test_trim_pod_keeps_rendered_fields():
+    assert graph.trim_pod(PODS[0]) == PodLite('web-1', 'a', 'Running', ('data',))
+
+
+def test_trim_pod_defaults_missing_fields():
+    assert graph.trim_pod({"metadata": {"name": "bare", "namespace": "a"}}) == PodLite('bare', 'a', 'Unknown', ())
+
+
+def test_trim_pvc_keeps_rendered_fields():
+    assert graph.trim_pvc(PVCS[0]) == PvcLite('data', 'a', 'Bound', '1Gi', 'pv-1')
+
+
+def test_trim_pvc_defaults_missing_fields():
+    assert graph.trim_pvc({"metadata": {"name": "claim", "namespace": "a"}}) == PvcLite('claim', 'a', 'Unknown',
+                                                                                          'Unknown', None)
+
+
+def test_trim_volume_keeps_rendered_fields():
+    assert graph.trim_volume(PVS[1]) == VolumeLite('pv-2', 'Available', '2Gi')
+
+
+def test_trim_volume_defaults_missing_fields():
+    assert graph.trim_volume({"metadata": {"name": "pv"}, "spec": None}) == VolumeLite('pv', 'Unknown', 'Unknown')
+
+
+@pytest.mark.parametrize("pattern, expected", [
+    ('web-1', False), ('web-*', True), ('web-?', True), ('web-[12]', True),
+])
+def test_is_wildcard(pattern, expected):
+    assert graph.is_wildcard(pattern) is expected
+
+
+def test_compile_patterns_matches_any_whole_pattern():
+    pod_filter = graph.compile_patterns(['web-*', 'db-1'])
+
+    assert pod_filter.match('web-1')
+    assert pod_filter.match('db-1')
+    assert not pod_filter.match('db-10')
+    assert not pod_filter.match('my-web-1')
+
+
+@pytest.fixture
+def disk_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(graph, 'DISK_CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(graph, '_disk_cache', (('config', 'context', 'user', 'https://server'), 60))
+    return tmp_path
+
+
+def test_disk_lookup_round_trip(disk_cache):
+    pods = (PodLite('web-1', 'a', 'Running', ('data', 'logs')),)
+    key = ('pods', 'a', None)
+
+    assert graph._disk_lookup(key, lambda: pods) == pods
+    cached = graph._disk_lookup(key, lambda: pytest.fail("read despite a fresh cache file"))
+
+    assert cached == pods
+    assert isinstance(cached[0].pvc_claims, tuple)
+
+
+def test_disk_lookup_ignores_corrupt_file(disk_cache):
+    volumes = (VolumeLite('pv-1', 'Bound', '1Gi'),)
+    key = ('volumes', None, None)
+    graph._disk_lookup(key, lambda: volumes)
+    (path,) = disk_cache.iterdir()
+    data = path.read_bytes()
+    path.write_bytes(data[:-16] + b'\x13' * 8 + data[-8:])
+    with pytest.raises(Exception):
+        gzip.decompress(path.read_bytes())
+
+    relisted = (VolumeLite('pv-2', 'Available', '2Gi'),)
+    assert graph._disk_lookup(key, lambda: relisted) == relisted
+
+
+def test_disk_lookup_is_keyed_on_credentials(disk_cache, monkeypatch):
+    key = ('pods', 'a', None)
+    graph._disk_lookup(key, lambda: (PodLite('web-1', 'a'),))
+    monkeypatch.setattr(graph, '_disk_cache', (('config', 'context', 'other-user', 'https://server'), 60))
+
+    assert graph._disk_lookup(key, lambda: ()) == ()
+    assert len(os.listdir(disk_cache)) == 2
+
+
+def test_gather_narrows_batched_results(api):
+    futures = [graph._get_executor().submit(graph.get_resources, 'pods')]
+
+    pods = graph._gather('pods', futures, ['a'])
+
+    assert sorted(pod.name for pod in pods) == ['db-1', 'web-1']
+
+
+def test_gather_falls_back_to_namespaces_when_cluster_list_is_refused(api):
+    api.forbidden.add(('list_pod_for_all_namespaces', None))
+    futures = [graph._get_executor().submit(graph.get_resources, 'pods', None, None, expect_forbidden=True)]
+
+    pods = graph._gather('pods', futures, ['a', 'b', 'a'])
+
+    assert sorted(pod.name for pod in pods) == ['db-1', 'web-1', 'web-2']
+    assert sorted(call[:2] for call in api.calls if call[0] == 'list_namespaced_pod') == [
+        ('list_namespaced_pod', 'a'), ('list_namespaced_pod', 'b')]
+
+
+def test_fetch_selects_exact_pod_names_on_the_server(api):
+    pods, pvcs, volumes = graph.fetch_resources(['a'], ['web-1'])
+
+    assert [pod.name for pod in pods] == ['web-1']
+    assert ('list_namespaced_pod', 'a', 'metadata.name=web-1') in api.calls
+
+
+def test_fetch_reads_claimed_pvcs_and_bound_volumes_one_by_one(api):
+    pods, pvcs, volumes = graph.fetch_resources(['a'], ['web-*'])
+
+    assert [pod.name for pod in pods] == ['web-1']
+    assert pvcs == [PvcLite('data', 'a', 'Bound', '1Gi', 'pv-1')]
+    assert volumes == [VolumeLite('pv-1', 'Bound', '1Gi')]
+    methods = {call[0] for call in api.calls}
+    assert methods == {'list_namespaced_pod', 'read_namespaced_persistent_volume_claim', 'read_persistent_volume'}
+
+
+def test_fetch_skips_volumes_when_no_claim_is_bound(api):
+    pods, pvcs, volumes = graph.fetch_resources(['a'], ['db-1'])
+
+    assert [pod.name for pod in pods] == ['db-1']
+    assert pvcs == volumes == []
+    assert {call[0] for call in api.calls} == {'list_namespaced_pod'}
+
+
+def test_fetch_lists_pvcs_above_single_read_threshold(api, monkeypatch):
+    monkeypatch.setattr(graph, 'SINGLE_READ_THRESHOLD', 0)
+
+    pods, pvcs, volumes = graph.fetch_resources(['a'], ['web-*'])
+
+    assert pvcs == [PvcLite('data', 'a', 'Bound', '1Gi', 'pv-1')]
+    assert volumes == [VolumeLite('pv-1', 'Bound', '1Gi')]
+    methods = {call[0] for call in api.calls}
+    assert 'list_namespaced_persistent_volume_claim' in methods
+    assert 'read_namespaced_persistent_volume_claim' not in methods
+
+
+def test_fetch_without_filter_lists_everything(api):
+    pods, pvcs, volumes = graph.fetch_resources(None, None)
+
+    assert sorted(pod.name for pod in pods) == ['db-1', 'web-1', 'web-2']
+    assert sorted(pvc.name for pvc in pvcs) == ['data', 'logs']
+    assert sorted(volume.name for volume in volumes) == ['pv-1', 'pv-2']
@@ -0,0 +1,46 @@
+from graph import PodLite, PvcLite, VolumeLite, create_resource_graph, node_labels
+
+
+def test_same_named_pvcs_in_two_namespaces_keep_their_bindings():
+    pods = [PodLite('web', 'a', 'Running', ('data',)), PodLite('web', 'b', 'Running', ('data',))]
+    pvcs = [PvcLite('data', 'a', 'Bound', '1Gi', 'pv-a'), PvcLite('data', 'b', 'Bound', '2Gi', 'pv-b')]
+    volumes = [VolumeLite('pv-a', 'Bound', '1Gi'), VolumeLite('pv-b', 'Bound', '2Gi')]
+
+    G = create_resource_graph(pods, pvcs, volumes)
+
+    pvc_nodes = [node for node, kind in G.nodes(data='kind') if kind == 'pvc']
+    assert sorted(pvc_nodes) == [('pvc', 'a', 'data'), ('pvc', 'b', 'data')]
+    assert G.nodes[('pvc', 'a', 'data')]['capacity'] == '1Gi'
+    assert G.nodes[('pvc', 'b', 'data')]['capacity'] == '2Gi'
+    assert list(G.successors(('pvc', 'a', 'data'))) == [('volume', None, 'pv-a')]
+    assert list(G.successors(('pvc', 'b', 'data'))) == [('volume', None, 'pv-b')]
+    assert list(G.successors(('pod', 'a', 'web'))) == [('pvc', 'a', 'data')]
+
+
+def test_objects_of_different_kinds_may_share_a_name():
+    G = create_resource_graph([PodLite('data', 'a', 'Running', ('data',))],
+                              [PvcLite('data', 'a', 'Bound', '1Gi', 'data')],
+                              [VolumeLite('data', 'Bound', '1Gi')])
+
+    assert sorted(G.nodes(data='kind')) == [(('pod', 'a', 'data'), 'pod'), (('pvc', 'a', 'data'), 'pvc'),
+                                            (('volume', None, 'data'), 'volume')]
+    assert G.number_of_edges() == 2
+
+
+def test_node_labels_render_name_status_and_capacity():
+    G = create_resource_graph([PodLite('web-1', 'a', 'Running', ('data',))],
+                              [PvcLite('data', 'a', 'Bound', '1Gi', 'pv-1')],
+                              [VolumeLite('pv-1', 'Bound', '1Gi'), VolumeLite('pv-2', 'Available', '2Gi')])
+
+    assert node_labels(G) == {
+        ('pod', 'a', 'web-1'): "web-1\nStatus: Running",
+        ('pvc', 'a', 'data'): "data\nCapacity: 1Gi\nStatus: Bound\nType: PVC",
+        ('volume', None, 'pv-1'): "pv-1\nCapacity: 1Gi\nStatus: Bound\nType: Volume",
+        ('volume', None, 'pv-2'): "pv-2\nCapacity: 2Gi\nStatus: Available\nType: Volume",
+    }
+
+
+def test_unlisted_pvc_and_volume_are_labelled_unknown():
+    G = create_resource_graph([PodLite('web-1', 'a', 'Pending', ('data',))], [], [])
+
+    assert node_labels(G)[('pvc', 'a', 'data')] == "data\nCapacity: Unknown\nStatus: Unknown\nType: PVC"